@@ -6,6 +6,10 @@ Centralizes all business rules, thresholds, and settings
 from typing import Dict, List, Any
 from enum import Enum
 
+# Translation table that strips currency formatting (and spaces) from numeric strings.
+# Shared by every money and head-count parser so the cleanup is a single C-level pass.
+MONEY_STRIP = str.maketrans('', '', '$, ')
+
 class BusinessConfig:
     """Central configuration for all business rules and settings"""
     
@@ -250,8 +254,8 @@ Underwriting Team
         coverage = extracted_data.get("coverage_amount", 0)
         if isinstance(coverage, str):
             try:
-                coverage = float(coverage.replace("$", "").replace(",", ""))
-            except:
+                coverage = float(coverage.translate(MONEY_STRIP))
+            except ValueError:
                 coverage = 0
         
         if coverage < cls.AUTO_REJECTION_CRITERIA["min_coverage"]:
@@ -8,7 +8,7 @@ import logging
 from datetime import datetime
 import re
 import random
-from business_config import BusinessConfig
+from business_config import BusinessConfig, MONEY_STRIP
 
 logger = logging.getLogger(__name__)
 
@@ -168,7 +168,7 @@ class CyberInsuranceValidator:
             coverage_str = str(coverage_str)
             
             # Remove common formatting characters
-            clean_str = coverage_str.replace("$", "").replace(",", "").replace(" ", "")
+            clean_str = coverage_str.translate(MONEY_STRIP)
             
             # Handle millions notation
             if "M" in clean_str.upper() or "million" in clean_str.lower():
@@ -210,7 +210,7 @@ class CyberInsuranceValidator:
             employee_str = str(employee_str)
             
             # Remove common formatting
-            clean_str = employee_str.replace(",", "").replace(" ", "")
+            clean_str = employee_str.translate(MONEY_STRIP)
             
             # Handle ranges (take the upper bound)
             if "-" in clean_str:
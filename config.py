@@ -24,6 +24,8 @@ class Settings(BaseSettings):
     guidewire_auth_endpoint: str = "/rest/common/v1/login"  # Token generation endpoint
     guidewire_timeout: int = 30
     guidewire_token_buffer: int = 300  # Refresh token 5 minutes before expiry
+    guidewire_max_inflight: int = 10  # Concurrent composite calls per process, sync and async callers combined
+    guidewire_bulkhead_wait: int = 5  # Seconds a caller queues for a free slot before being rejected
     
     # CORS Settings for Vercel
     # For production, set to comma-separated list of allowed origins
@@ -112,7 +112,7 @@ class WorkItem(Base):
     __tablename__ = "work_items"
     
     id = Column(Integer, primary_key=True, index=True)
-    submission_id = Column(Integer, ForeignKey("submissions.id"), nullable=False)
+    submission_id = Column(Integer, ForeignKey("submissions.id"), nullable=False, index=True)
     
     # Basic work item fields
     title = Column(String(500))
@@ -4,13 +4,24 @@ Test script to debug Guidewire approval issue for job 0000749253
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Configuration
 BASE_URL = "https://wu-workbench-backend-h3fkfkcpbjgga7hx.centralus-01.azurewebsites.net"
 GUIDEWIRE_BASE = "https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net"
 
+# Shared session so repeat calls to the backend and Guidewire reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
 def test_approval_workflow():
     """Debug the approval workflow for job 0000749253"""
     
@@ -20,11 +31,22 @@ def test_approval_workflow():
     print(f"Target Job: 0000749253")
     print()
     
+    # The UW issues lookup only needs the job number, so start it alongside the work item poll
+    executor = ThreadPoolExecutor(max_workers=2)
+    
     try:
+        uw_issues_future = executor.submit(
+            SESSION.get,
+            f"{GUIDEWIRE_BASE}/rest/job/v1/jobs/0000749253/uw-issues",
+            auth=("su", "gw"),
+            headers={'Accept': 'application/json'},
+            timeout=10
+        )
+        
         # Step 1: Find the work item with job ID 0000749253
         print("1️⃣ Finding work item with Guidewire job 0000749253...")
         
-        workitems_response = requests.get(f"{BASE_URL}/api/workitems/poll?limit=50")
+        workitems_response = SESSION.get(f"{BASE_URL}/api/workitems/poll?limit=50")
         
         if workitems_response.status_code != 200:
             print(f"❌ Failed to get work items: {workitems_response.status_code}")
@@ -65,12 +87,7 @@ def test_approval_workflow():
         print("2️⃣ Checking current UW issues in Guidewire...")
         
         try:
-            uw_issues_response = requests.get(
-                f"{GUIDEWIRE_BASE}/rest/job/v1/jobs/0000749253/uw-issues",
-                auth=("su", "gw"),
-                headers={'Accept': 'application/json'},
-                timeout=10
-            )
+            uw_issues_response = uw_issues_future.result()
             
             print(f"   UW Issues response: {uw_issues_response.status_code}")
             
@@ -93,7 +110,7 @@ def test_approval_workflow():
             "approved_by": "Debug Script"
         }
         
-        approval_response = requests.post(
+        approval_response = SESSION.post(
             f"{BASE_URL}/api/workitems/{work_item_id}/approve",
             json=approval_payload,
             headers={'Content-Type': 'application/json'}
@@ -114,7 +131,7 @@ def test_approval_workflow():
         # Step 4: Check final status
         print("4️⃣ Checking final status...")
         
-        final_check = requests.get(f"{BASE_URL}/api/workitems/poll?work_item_id={work_item_id}")
+        final_check = SESSION.get(f"{BASE_URL}/api/workitems/poll?work_item_id={work_item_id}")
         
         if final_check.status_code == 200:
             final_data = final_check.json()
@@ -135,6 +152,8 @@ def test_approval_workflow():
     except Exception as e:
         print(f"❌ Error in approval workflow test: {e}")
         return False
+    finally:
+        executor.shutdown(wait=False)
 
 def test_direct_guidewire_connection():
     """Test direct connection to Guidewire server"""
@@ -144,7 +163,7 @@ def test_direct_guidewire_connection():
     
     try:
         # Test basic connectivity
-        test_response = requests.get(
+        test_response = SESSION.get(
             f"{GUIDEWIRE_BASE}/rest/job/v1/jobs/0000749253",
             auth=("su", "gw"),
             headers={'Accept': 'application/json'},
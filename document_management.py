@@ -128,7 +128,7 @@ class DocumentStore:
             # Check date range
             upload_date = doc_info.get('upload_date')
             if isinstance(upload_date, str):
-                upload_date = datetime.fromisoformat(upload_date.replace('Z', '+00:00'))
+                upload_date = datetime.fromisoformat(upload_date)
             
             if criteria.get('date_from') and upload_date and upload_date < criteria['date_from']:
                 matches = False
@@ -8,82 +8,628 @@ This module handles the 3-step integration:
 3. Quote Creation → Get Quote Document
 """
 
+import asyncio
 import logging
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 from datetime import datetime
 import json
+import orjson
+import random
+import threading
+import time
+from collections import deque
+
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+
+# Constant parts of the account + submission composite payload. Built once at import
+# and shared by every request; treat them as read-only.
+_PRODUCER_CODES = [
+    {
+        "id": "pc:2"
+    }
+]
+
+_ORGANIZATION_TYPE = {
+    "code": "other"
+}
+
+_ACCOUNT_VARS = [
+    {
+        "name": "accountId",
+        "path": "$.data.attributes.id"
+    },
+    {
+        "name": "driverId",
+        "path": "$.data.attributes.accountHolder.id"
+    }
+]
+
+_JOB_VARS = [
+    {
+        "name": "jobId",
+        "path": "$.data.attributes.id"
+    }
+]
+
+# Cyber line coverages, line details and quote request - identical for every submission
+_CYBER_LINE_REQUESTS = (
+    {
+        "method": "post",
+        "uri": "/job/v1/jobs/${jobId}/lines/USCyberLine/coverages",
+        "body": {
+            "data": {
+                "attributes": {
+                    "pattern": {
+                        "id": "ACLCommlCyberLiability"
+                    },
+                    "terms": {
+                        "ACLCommlCyberLiabilityBusIncLimit": {
+                            "choiceValue": {
+                                "code": "10Kusd",
+                                "name": "10,000"
+                            }
+                        },
+                        "ACLCommlCyberLiabilityCyberAggLimit": {
+                            "choiceValue": {
+                                "code": "50Kusd",
+                                "name": "50,000"
+                            }
+                        },
+                        "ACLCommlCyberLiabilityExtortion": {
+                            "choiceValue": {
+                                "code": "5Kusd",
+                                "name": "5,000"
+                            }
+                        },
+                        "ACLCommlCyberLiabilityPublicRelations": {
+                            "choiceValue": {
+                                "code": "5Kusd",
+                                "name": "5000"
+                            }
+                        },
+                        "ACLCommlCyberLiabilityRetention": {
+                            "choiceValue": {
+                                "code": "75Kusd",
+                                "name": "7,500"
+                            }
+                        },
+                        "ACLCommlCyberLiabilityWaitingPeriod": {
+                            "choiceValue": {
+                                "code": "12HR",
+                                "name": "12 hrs"
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    },
+    {
+        "method": "patch",
+        "uri": "/job/v1/jobs/${jobId}/lines/USCyberLine",
+        "body": {
+            "data": {
+                "attributes": {
+                    "aclDateBusinessStarted": "2020-01-01T00:00:00.000Z",
+                    "aclPolicyType": {
+                        "code": "commercialcyber",
+                        "name": "Commercial Cyber"
+                    },
+                    "aclTotalAssets": "500000.00",
+                    "aclTotalFTEmployees": 10,
+                    "aclTotalLiabilities": "50000.00",
+                    "aclTotalPTEmployees": 5,
+                    "aclTotalPayroll": "750000.00",
+                    "aclTotalRevenues": "1000000.00"
+                }
+            }
+        }
+    },
+    {
+        "method": "post",
+        "uri": "/job/v1/jobs/${jobId}/quote"
+    }
+)
+
+
+# Response headers worth logging; the rest (cookies, auth echoes) stay out of the logs
+_LOGGED_RESPONSE_HEADERS = ("Content-Type", "Content-Length", "Date")
+
+# Upper bound on how much of a Guidewire body is written into a single log line
+LOG_PREVIEW_LIMIT = 1000
+
+_PREVIEW_ENCODER = json.JSONEncoder(indent=2, default=str)
+
+
+def _preview(obj: Any, limit: int = LOG_PREVIEW_LIMIT) -> str:
+    """
+    Render a body for logging, stopping after roughly `limit` characters.
+    Dicts/lists are encoded incrementally so a multi-megabyte response is never serialized in full.
+    """
+    if isinstance(obj, bytes):
+        obj = obj[:limit + 1].decode("utf-8", "replace")
+    if isinstance(obj, str):
+        text = obj
+    else:
+        chunks = []
+        size = 0
+        for chunk in _PREVIEW_ENCODER.iterencode(obj):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > limit:
+                break
+        text = "".join(chunks)
+    if len(text) > limit:
+        return text[:limit] + "... (truncated)"
+    return text
+
+
+def _dig(obj: Any, *path: str) -> Any:
+    """Follow a chain of dict keys, returning None as soon as a level is missing or not a dict"""
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+        if obj is None:
+            return None
+    return obj
+
+
+class JitteredRetry(Retry):
+    """
+    urllib3 Retry with full-jitter exponential backoff.
+    POSTs are only retried on 429 + Retry-After, i.e. the request was throttled before being
+    processed and is safe to send again. A 503 is not replayed: a gateway can return it after
+    Guidewire already applied the request, and a replay could duplicate an account or approval.
+    Server-sent Retry-After waits are capped so a large value can't stall the caller.
+    """
+    
+    POST_RETRY_STATUS_CODES = (429,)
+    MAX_RETRY_AFTER = 5.0
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return random.uniform(0, backoff)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method and method.upper() == "POST":
+            return bool(self.total) and has_retry_after and status_code in self.POST_RETRY_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class CircuitBreaker:
+    """
+    Minimal closed -> open -> half-open breaker for the Guidewire composite API.
+    Opens after `failure_threshold` consecutive failures and lets a single trial
+    request through once `recovery_timeout` seconds have passed. A trial that never
+    reports back is superseded by a new one after another `recovery_timeout`.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str = "guidewire", failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self.trial_started_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self.opened_at >= self.recovery_timeout:
+                # Let one trial request through
+                self.state = self.HALF_OPEN
+                self.trial_started_at = now
+                return True
+            if self.state == self.HALF_OPEN and now - self.trial_started_at >= self.recovery_timeout:
+                # The previous trial never reported back; don't stay half-open forever
+                self.trial_started_at = now
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Circuit breaker %s closed - Guidewire recovered", self.name)
+            self.state = self.CLOSED
+            self.failure_count = 0
+    
+    def record_failure(self):
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("Circuit breaker %s opened after %d consecutive failures", self.name, self.failure_count)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+    
+    def abandon_trial(self):
+        """Hand back a half-open trial that ended without an outcome (e.g. the caller was cancelled)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                # opened_at is already past recovery_timeout, so the next caller gets a fresh trial
+                self.state = self.OPEN
+
+
+# One breaker per upstream URL, shared by every integration instance in the process
+_CIRCUIT_BREAKERS: Dict[str, CircuitBreaker] = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(key: str, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> CircuitBreaker:
+    """Return the process-wide breaker for `key`, creating it on first use"""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(key, failure_threshold, recovery_timeout)
+            _CIRCUIT_BREAKERS[key] = breaker
+        return breaker
+
+
+class LatencyTracker:
+    """Rolling reservoir of recent call latencies with percentile snapshots"""
+    
+    def __init__(self, size: int = 1024):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+        
+        def percentile(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))] * 1000, 1)
+        
+        return {
+            "count": len(samples),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(samples[-1] * 1000, 1)
+        }
+
+
 class GuidewireIntegration:
     def __init__(self):
         # Guidewire connection details from team
-        self.base_url = "https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/composite/v1/composite"
+        self.host_url = "https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net"
+        self.base_url = f"{self.host_url}/rest/composite/v1/composite"
         self.username = "su"
         self.password = "gw"
         self.timeout = 30
+        # Fail a dead TCP/TLS handshake fast; the read budget stays at self.timeout for slow composite calls
+        self.connect_timeout = 3
+        self.request_timeout = (self.connect_timeout, self.timeout)
+        
+        # Keep-alive pool sizing; every call goes to the single Guidewire host
+        self.pool_connections = 1
+        self.pool_maxsize = 20
+        
+        # Transient failures are retried for idempotent GETs; composite/approve/decline POSTs
+        # could create duplicate accounts, so they are only replayed on an explicit 429 Retry-After
+        self.max_retries = 3
+        self.retry_backoff_factor = 0.5
+        self.retry_status_codes = (429, 502, 503, 504)
+        self.session = self._build_session()
+        
+        # Fail fast instead of waiting out the timeout while Guidewire is down
+        self.circuit_breaker = get_circuit_breaker(self.base_url, failure_threshold=5, recovery_timeout=30)
+        
+        # Created on first async use so it binds to the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
+        # Successful connection tests are reused for a short window: (monotonic timestamp, result)
+        self.connection_test_ttl = 30
+        self._connection_test_cache: Optional[tuple] = None
+        
+        # Composite call latencies, for timeout tuning without an external APM
+        self.latency = LatencyTracker()
+        
+        # Maximum concurrent composite calls from this process, and how long excess callers queue.
+        # Sync and async callers draw from this one semaphore; async callers poll it (see _acquire_bulkhead_async).
+        self.max_concurrent_requests = settings.guidewire_max_inflight
+        self.bulkhead_wait = settings.guidewire_bulkhead_wait
+        self.bulkhead_poll_interval = 0.05
+        self._bulkhead = threading.BoundedSemaphore(self.max_concurrent_requests)
+        
+    def _build_session(self) -> requests.Session:
+        """Create a pooled session so Guidewire calls reuse warm TLS connections"""
+        session = requests.Session()
+        session.auth = (self.username, self.password)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True,
+            max_retries=JitteredRetry(
+                total=self.max_retries,
+                backoff_factor=self.retry_backoff_factor,
+                status_forcelist=self.retry_status_codes,
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        # Mounted on the Guidewire host prefix so its calls always share this one pool
+        session.mount(f"{self.host_url}/", adapter)
+        return session
         
     def _make_request(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Make authenticated request to Guidewire composite API"""
+        # Bulkhead: cap concurrent composite calls so a flood of work items queues here
+        # instead of piling onto the connection pool and Guidewire. Taken before the breaker
+        # check so a half-open trial request is never dropped by the bulkhead.
+        if not self._acquire_bulkhead():
+            logger.warning("Guidewire bulkhead full - rejecting request")
+            return {
+                "success": False,
+                "error": "BulkheadFull",
+                "message": f"Too many concurrent Guidewire requests (limit {self.max_concurrent_requests})"
+            }
+        
+        try:
+            if not self.circuit_breaker.allow_request():
+                logger.debug("Guidewire circuit breaker is open - skipping request")
+                return {
+                    "success": False,
+                    "error": "CircuitOpen",
+                    "message": f"Guidewire unavailable after repeated failures; retrying in {self.circuit_breaker.recovery_timeout} seconds"
+                }
+            
+            return self._post_composite(payload)
+        finally:
+            self._bulkhead.release()
+
+    def _post_composite(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a composite payload and convert the outcome into the standard result dict"""
         try:
             headers = {
                 'Content-Type': 'application/json',
                 'Accept': 'application/json'
             }
             
-            logger.info(f"Making Guidewire request to: {self.base_url}")
-            logger.info(f"Request payload: {json.dumps(payload, indent=2)}")
+            logger.info("Making Guidewire request to: %s", self.base_url)
+            # Pretty-printing the composite payload is only worth paying for when DEBUG is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Request payload: %s", orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
             
-            response = requests.post(
-                self.base_url,
-                json=payload,
+            # orjson serializes the nested composite tree much faster than requests' stdlib json
+            started = time.perf_counter()
+            try:
+                response = self.session.post(
+                    self.base_url,
+                    data=orjson.dumps(payload),
+                    headers=headers,
+                    timeout=self.request_timeout
+                )
+            finally:
+                # Timed-out and failed calls are recorded too; they are the tail that matters for tuning
+                self.latency.record(time.perf_counter() - started)
+            
+            return self._composite_result(response)
+                
+        except requests.exceptions.Timeout as e:
+            self.circuit_breaker.record_failure()
+            self._connection_test_cache = None
+            return self._timeout_result(isinstance(e, requests.exceptions.ConnectTimeout))
+        except requests.exceptions.ConnectionError as e:
+            self.circuit_breaker.record_failure()
+            self._connection_test_cache = None
+            logger.error("Guidewire connection error: %s", e)
+            return {
+                "success": False,
+                "error": "ConnectionError",
+                "message": f"Failed to connect to Guidewire: {str(e)}"
+            }
+        except Exception as e:
+            self.circuit_breaker.record_failure()
+            self._connection_test_cache = None
+            logger.error("Unexpected error in Guidewire request: %s", e)
+            return {
+                "success": False,
+                "error": "UnexpectedError",
+                "message": str(e)
+            }
+        except BaseException:
+            # Cancellation/interrupt says nothing about Guidewire's health; just free a half-open trial
+            self.circuit_breaker.abandon_trial()
+            raise
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Shared async client so concurrent composite calls reuse keep-alive connections"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
                 auth=(self.username, self.password),
-                headers=headers,
-                timeout=self.timeout
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.pool_maxsize,
+                    max_connections=self.pool_maxsize * 5
+                )
             )
-            
-            logger.info(f"Guidewire response status: {response.status_code}")
-            logger.info(f"Response headers: {dict(response.headers)}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                logger.info(f"Successful response: {json.dumps(result, indent=2)}")
-                return {
-                    "success": True,
-                    "data": result,
-                    "status_code": response.status_code
-                }
-            else:
-                logger.error(f"Guidewire request failed: {response.status_code} - {response.text}")
+        return self._async_client
+
+    async def _make_request_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of _make_request; same bulkhead, breaker and result shape"""
+        if not await self._acquire_bulkhead_async():
+            logger.warning("Guidewire bulkhead full - rejecting request")
+            return {
+                "success": False,
+                "error": "BulkheadFull",
+                "message": f"Too many concurrent Guidewire requests (limit {self.max_concurrent_requests})"
+            }
+        
+        try:
+            if not self.circuit_breaker.allow_request():
+                logger.debug("Guidewire circuit breaker is open - skipping request")
                 return {
                     "success": False,
-                    "error": f"HTTP {response.status_code}",
-                    "message": response.text,
-                    "status_code": response.status_code
+                    "error": "CircuitOpen",
+                    "message": f"Guidewire unavailable after repeated failures; retrying in {self.circuit_breaker.recovery_timeout} seconds"
                 }
-                
-        except requests.exceptions.Timeout:
-            logger.error("Guidewire request timed out")
-            return {
-                "success": False,
-                "error": "Timeout",
-                "message": f"Request timed out after {self.timeout} seconds"
+            
+            return await self._post_composite_async(payload)
+        finally:
+            self._bulkhead.release()
+
+    def _acquire_bulkhead(self) -> bool:
+        """
+        Take a slot from the shared bulkhead for a sync caller, queueing up to bulkhead_wait.
+        A sync call made on the event-loop thread only tries once: the coroutines holding the
+        slots run on that same loop, so blocking it could never free one.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._bulkhead.acquire(timeout=self.bulkhead_wait)
+        logger.warning("Sync Guidewire call made on the event loop - use the async variant")
+        return self._bulkhead.acquire(blocking=False)
+
+    async def _acquire_bulkhead_async(self) -> bool:
+        """
+        Take a slot from the shared threading bulkhead without blocking the event loop.
+        Polls with non-blocking acquires so a cancelled caller never leaves a slot taken.
+        """
+        deadline = time.monotonic() + self.bulkhead_wait
+        while not self._bulkhead.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.bulkhead_poll_interval)
+        return True
+
+    async def _post_composite_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Async counterpart of _post_composite"""
+        try:
+            headers = {
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
             }
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"Guidewire connection error: {str(e)}")
+            
+            logger.info("Making async Guidewire request to: %s", self.base_url)
+            
+            started = time.perf_counter()
+            try:
+                response = await self._get_async_client().post(
+                    self.base_url,
+                    content=orjson.dumps(payload),
+                    headers=headers
+                )
+            finally:
+                self.latency.record(time.perf_counter() - started)
+            
+            return self._composite_result(response)
+                
+        except httpx.TimeoutException as e:
+            self.circuit_breaker.record_failure()
+            self._connection_test_cache = None
+            return self._timeout_result(isinstance(e, httpx.ConnectTimeout))
+        except httpx.TransportError as e:
+            self.circuit_breaker.record_failure()
+            self._connection_test_cache = None
+            logger.error("Guidewire connection error: %s", e)
             return {
                 "success": False,
                 "error": "ConnectionError",
                 "message": f"Failed to connect to Guidewire: {str(e)}"
             }
         except Exception as e:
-            logger.error(f"Unexpected error in Guidewire request: {str(e)}")
+            self.circuit_breaker.record_failure()
+            self._connection_test_cache = None
+            logger.error("Unexpected error in Guidewire request: %s", e)
             return {
                 "success": False,
                 "error": "UnexpectedError",
                 "message": str(e)
             }
+        except BaseException:
+            # Cancellation/interrupt says nothing about Guidewire's health; just free a half-open trial
+            self.circuit_breaker.abandon_trial()
+            raise
+
+    def _timeout_result(self, connect_phase: bool) -> Dict[str, Any]:
+        """Timeout result naming the phase that timed out, since connect and read budgets differ"""
+        if connect_phase:
+            logger.error("Guidewire connect timed out after %s seconds", self.connect_timeout)
+            message = f"Connecting to Guidewire timed out after {self.connect_timeout} seconds"
+        else:
+            logger.error("Guidewire request timed out after %s seconds", self.timeout)
+            message = f"Request timed out after {self.timeout} seconds"
+        return {
+            "success": False,
+            "error": "Timeout",
+            "message": message
+        }
+
+    def latency_snapshot(self) -> Dict[str, Any]:
+        """p50/p95/p99 of recent composite calls, in milliseconds"""
+        return self.latency.snapshot()
+
+    async def aclose(self):
+        """Close the shared async client (call on application shutdown)"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _composite_result(self, response) -> Dict[str, Any]:
+        """Turn a composite API response (requests or httpx) into the standard result dict"""
+        logger.info("Guidewire response status: %s", response.status_code)
+        logged_headers = {name: response.headers.get(name) for name in _LOGGED_RESPONSE_HEADERS}
+        logger.info("Response headers: %s", logged_headers)
+        
+        # Only server-side failures count against the breaker; 4xx means Guidewire is up
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure()
+        else:
+            self.circuit_breaker.record_success()
+        
+        # A failed composite call means a cached "connected" result can no longer be trusted
+        if response.status_code != 200:
+            self._connection_test_cache = None
+        
+        if response.status_code == 200:
+            result = orjson.loads(response.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Successful response: %s", orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
+            return {
+                "success": True,
+                "data": result,
+                "status_code": response.status_code
+            }
+        else:
+            logger.error("Guidewire request failed: %s - %s", response.status_code, _preview(response.text))
+            return {
+                "success": False,
+                "error": f"HTTP {response.status_code}",
+                "message": response.text,
+                "status_code": response.status_code
+            }
 
     def create_account_and_submission(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -92,6 +638,25 @@ class GuidewireIntegration:
         """
         logger.info("Creating Guidewire account and submission with essential fields only")
         
+        payload = self._build_account_submission_payload(extracted_data)
+        
+        # Make the request
+        result = self._make_request(payload)
+        return self._parse_account_submission_result(result)
+
+    async def create_account_and_submission_async(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of create_account_and_submission for callers running on the event loop
+        Same payload and result shape, but the composite call doesn't block a worker thread
+        """
+        logger.info("Creating Guidewire account and submission (async)")
+        
+        payload = self._build_account_submission_payload(extracted_data)
+        result = await self._make_request_async(payload)
+        return self._parse_account_submission_result(result)
+
+    def _build_account_submission_payload(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the account + submission composite payload from extracted email data"""
         # Extract only essential data with safe defaults that Guidewire accepts
         company_name = str(extracted_data.get('company_name', 'Test Company')).strip()
         business_address = str(extracted_data.get('business_address', '123 Business St')).strip()
@@ -111,6 +676,16 @@ class GuidewireIntegration:
         if not business_zip:
             business_zip = '94105'
         
+        # The account holder's primary address and the primary location are the same block
+        address = {
+            "addressLine1": business_address,
+            "city": business_city,
+            "postalCode": business_zip,
+            "state": {
+                "code": business_state
+            }
+        }
+        
         # Use exact payload format from team
         payload = {
             "requests": [
@@ -124,44 +699,15 @@ class GuidewireIntegration:
                                     "contactSubtype": "Company",
                                     "companyName": company_name,
                                     "taxId": "12-1212121",  # TODO: Extract from data if available
-                                    "primaryAddress": {
-                                        "addressLine1": business_address,
-                                        "city": business_city,
-                                        "postalCode": business_zip,
-                                        "state": {
-                                            "code": business_state
-                                        }
-                                    }
+                                    "primaryAddress": address
                                 },
-                                "initialPrimaryLocation": {
-                                    "addressLine1": business_address,
-                                    "city": business_city,
-                                    "postalCode": business_zip,
-                                    "state": {
-                                        "code": business_state
-                                    }
-                                },
-                                "producerCodes": [
-                                    {
-                                        "id": "pc:2"
-                                    }
-                                ],
-                                "organizationType": {
-                                    "code": "other"
-                                }
+                                "initialPrimaryLocation": address,
+                                "producerCodes": _PRODUCER_CODES,
+                                "organizationType": _ORGANIZATION_TYPE
                             }
                         }
                     },
-                    "vars": [
-                        {
-                            "name": "accountId",
-                            "path": "$.data.attributes.id"
-                        },
-                        {
-                            "name": "driverId",
-                            "path": "$.data.attributes.accountHolder.id"
-                        }
-                    ]
+                    "vars": _ACCOUNT_VARS
                 },
                 {
                     "method": "post",
@@ -185,100 +731,22 @@ class GuidewireIntegration:
                             }
                         }
                     },
-                    "vars": [
-                        {
-                            "name": "jobId",
-                            "path": "$.data.attributes.id"
-                        }
-                    ]
-                },
-                {
-                    "method": "post",
-                    "uri": "/job/v1/jobs/${jobId}/lines/USCyberLine/coverages",
-                    "body": {
-                        "data": {
-                            "attributes": {
-                                "pattern": {
-                                    "id": "ACLCommlCyberLiability"
-                                },
-                                "terms": {
-                                    "ACLCommlCyberLiabilityBusIncLimit": {
-                                        "choiceValue": {
-                                            "code": "10Kusd",
-                                            "name": "10,000"
-                                        }
-                                    },
-                                    "ACLCommlCyberLiabilityCyberAggLimit": {
-                                        "choiceValue": {
-                                            "code": "50Kusd",
-                                            "name": "50,000"
-                                        }
-                                    },
-                                    "ACLCommlCyberLiabilityExtortion": {
-                                        "choiceValue": {
-                                            "code": "5Kusd",
-                                            "name": "5,000"
-                                        }
-                                    },
-                                    "ACLCommlCyberLiabilityPublicRelations": {
-                                        "choiceValue": {
-                                            "code": "5Kusd",
-                                            "name": "5000"
-                                        }
-                                    },
-                                    "ACLCommlCyberLiabilityRetention": {
-                                        "choiceValue": {
-                                            "code": "75Kusd",
-                                            "name": "7,500"
-                                        }
-                                    },
-                                    "ACLCommlCyberLiabilityWaitingPeriod": {
-                                        "choiceValue": {
-                                            "code": "12HR",
-                                            "name": "12 hrs"
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
+                    "vars": _JOB_VARS
                 },
-                {
-                    "method": "patch",
-                    "uri": "/job/v1/jobs/${jobId}/lines/USCyberLine",
-                    "body": {
-                        "data": {
-                            "attributes": {
-                                "aclDateBusinessStarted": "2020-01-01T00:00:00.000Z",
-                                "aclPolicyType": {
-                                    "code": "commercialcyber",
-                                    "name": "Commercial Cyber"
-                                },
-                                "aclTotalAssets": "500000.00",
-                                "aclTotalFTEmployees": 10,
-                                "aclTotalLiabilities": "50000.00",
-                                "aclTotalPTEmployees": 5,
-                                "aclTotalPayroll": "750000.00",
-                                "aclTotalRevenues": "1000000.00"
-                            }
-                        }
-                    }
-                },
-                {
-                    "method": "post",
-                    "uri": "/job/v1/jobs/${jobId}/quote"
-                }
+                *_CYBER_LINE_REQUESTS
             ]
         }
         
-        # Make the request
-        result = self._make_request(payload)
-        
+        return payload
+
+    def _parse_account_submission_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Pull account/job IDs and numbers out of the composite response"""
         if result["success"]:
             # Parse the response to extract account and job IDs
             try:
                 data = result["data"]
-                logger.info(f"Full Guidewire response data structure: {json.dumps(data, indent=2)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Full Guidewire response data structure: %s", orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
                 
                 # Extract both internal IDs and human-readable numbers from composite response
                 account_id = None
@@ -286,56 +754,58 @@ class GuidewireIntegration:
                 account_number = None
                 job_number = None
                 
+                # Account ID from the account-creation response, used if no job carries it
+                created_account_id = None
+                
                 # Check if response has the expected composite structure
-                if "responses" in data and isinstance(data["responses"], list):
-                    logger.info(f"Found {len(data['responses'])} responses in composite result")
+                responses = data.get("responses")
+                if isinstance(responses, list):
+                    logger.info("Found %d responses in composite result", len(responses))
                     
-                    # The quote response (last response) contains all the IDs we need
-                    for i, response in enumerate(data["responses"]):
-                        logger.info(f"Response {i}: Status={response.get('status')}")
+                    # Single pass over the responses; stop once every identifier has been found
+                    for i, response in enumerate(responses):
+                        logger.info("Response %d: Status=%s", i, response.get("status"))
+                        
+                        if response.get("status") not in (200, 201):
+                            continue
+                        
+                        # Check if this response has the job/quote information
+                        attrs = _dig(response, "body", "data", "attributes")
+                        if not attrs:
+                            continue
+                        
+                        # Look for job ID and job number (human-readable identifier)
+                        if "id" in attrs and str(attrs["id"]).startswith("pc:S"):
+                            job_id = attrs["id"]
+                            logger.info("Found job ID: %s", job_id)
+                        
+                        if "jobNumber" in attrs:
+                            job_number = attrs["jobNumber"]
+                            logger.info("Found job number: %s", job_number)
+                        
+                        # Extract account information from nested account object
+                        account_info = attrs.get("account")
+                        if isinstance(account_info, dict):
+                            if "id" in account_info:
+                                account_id = account_info["id"]
+                                logger.info("Found account ID: %s", account_id)
+                            if "displayName" in account_info:
+                                account_number = account_info["displayName"]
+                                logger.info("Found account number: %s", account_number)
                         
-                        if response.get("status") == 200 or response.get("status") == 201:
-                            body = response.get("body", {})
-                            
-                            # Check if this response has the job/quote information
-                            if "data" in body and "attributes" in body["data"]:
-                                attrs = body["data"]["attributes"]
-                                
-                                # Look for job ID and job number (human-readable identifier)
-                                if "id" in attrs and str(attrs["id"]).startswith("pc:S"):
-                                    job_id = attrs["id"]
-                                    logger.info(f"Found job ID: {job_id}")
-                                
-                                if "jobNumber" in attrs:
-                                    job_number = attrs["jobNumber"]
-                                    logger.info(f"Found job number: {job_number}")
-                                
-                                # Extract account information from nested account object
-                                if "account" in attrs and isinstance(attrs["account"], dict):
-                                    account_info = attrs["account"]
-                                    if "id" in account_info:
-                                        account_id = account_info["id"]
-                                        logger.info(f"Found account ID: {account_id}")
-                                    if "displayName" in account_info:
-                                        account_number = account_info["displayName"]
-                                        logger.info(f"Found account number: {account_number}")
+                        # Remember the account creation response (has accountHolder, primaryAddress, etc.)
+                        if created_account_id is None and "id" in attrs and ("accountHolder" in attrs or "initialAccountHolder" in attrs):
+                            created_account_id = attrs["id"]
+                        
+                        if account_id and job_id and account_number and job_number:
+                            break
                 
-                # If we have job_id but no account_id, try to extract from other responses
-                if job_id and not account_id:
-                    # Look through earlier responses for account creation
-                    for i, response in enumerate(data["responses"]):
-                        if response.get("status") in [200, 201]:
-                            body = response.get("body", {})
-                            if "data" in body and "attributes" in body["data"]:
-                                attrs = body["data"]["attributes"]
-                                # Look for account creation response (has accountHolder, primaryAddress, etc.)
-                                if "accountHolder" in attrs or "initialAccountHolder" in attrs:
-                                    if "id" in attrs:
-                                        account_id = attrs["id"]
-                                        logger.info(f"Found account ID from account creation response: {account_id}")
-                                        break
+                # If we have job_id but no account_id, fall back to the account creation response
+                if job_id and not account_id and created_account_id:
+                    account_id = created_account_id
+                    logger.info("Found account ID from account creation response: %s", account_id)
                 
-                logger.info(f"Final extracted IDs - Account: {account_id} (#{account_number}), Job: {job_id} (#{job_number})")
+                logger.info("Final extracted IDs - Account: %s (#%s), Job: %s (#%s)", account_id, account_number, job_id, job_number)
                 
                 return {
                     "success": True,
@@ -348,7 +818,7 @@ class GuidewireIntegration:
                 }
                 
             except Exception as parse_error:
-                logger.error(f"Error parsing Guidewire response: {str(parse_error)}")
+                logger.error("Error parsing Guidewire response: %s", parse_error)
                 return {
                     "success": False,
                     "error": "ParseError", 
@@ -371,18 +841,17 @@ class GuidewireIntegration:
         
         try:
             # Step 1: Get UW issues for the job using direct REST API
-            uw_issues_url = f"https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/job/v1/jobs/{job_id}/uw-issues"
+            uw_issues_url = f"{self.host_url}/rest/job/v1/jobs/{job_id}/uw-issues"
             
             headers = {
                 'Accept': 'application/json'
             }
             
             logger.info(f"Getting UW issues for job: {job_id}")
-            response = requests.get(
+            response = self.session.get(
                 uw_issues_url,
-                auth=(self.username, self.password),
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.request_timeout
             )
             
             logger.info(f"UW issues response status: {response.status_code}")
@@ -394,8 +863,9 @@ class GuidewireIntegration:
                     "message": f"Failed to get UW issues: {response.text}"
                 }
             
-            uw_issues_data = response.json()
-            logger.info(f"UW issues response: {json.dumps(uw_issues_data, indent=2)}")
+            uw_issues_data = orjson.loads(response.content)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("UW issues response: %s", _preview(uw_issues_data))
             
             # Extract UW issues
             uw_issues = []
@@ -419,7 +889,7 @@ class GuidewireIntegration:
             
             for issue in uw_issues:
                 try:
-                    issue_id = issue.get("attributes", {}).get("id")
+                    issue_id = _dig(issue, "attributes", "id")
                     if not issue_id:
                         logger.warning(f"UW issue missing ID: {issue}")
                         continue
@@ -445,14 +915,13 @@ class GuidewireIntegration:
                     if underwriter_notes:
                         approval_body["data"]["attributes"]["approvalNotes"] = underwriter_notes
                     
-                    approve_url = f"https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/job/v1/jobs/{job_id}/uw-issues/{issue_id}/approve"
+                    approve_url = f"{self.host_url}/rest/job/v1/jobs/{job_id}/uw-issues/{issue_id}/approve"
                     
-                    approve_response = requests.post(
+                    approve_response = self.session.post(
                         approve_url,
-                        json=approval_body,
-                        auth=(self.username, self.password),
+                        data=orjson.dumps(approval_body),
                         headers={'Content-Type': 'application/json', 'Accept': 'application/json'},
-                        timeout=self.timeout
+                        timeout=self.request_timeout
                     )
                     
                     logger.info(f"UW issue {issue_id} approval status: {approve_response.status_code}")
@@ -466,7 +935,7 @@ class GuidewireIntegration:
                             "status_code": approve_response.status_code,
                             "error": approve_response.text
                         })
-                        logger.error(f"Failed to approve UW issue {issue_id}: {approve_response.status_code} - {approve_response.text}")
+                        logger.error(f"Failed to approve UW issue {issue_id}: {approve_response.status_code} - {_preview(approve_response.text)}")
                 
                 except Exception as issue_error:
                     logger.error(f"Error approving UW issue {issue_id}: {str(issue_error)}")
@@ -526,7 +995,7 @@ class GuidewireIntegration:
         
         try:
             # Use the decline endpoint from the Guidewire API
-            decline_url = f"https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/job/v1/jobs/{job_id}/decline"
+            decline_url = f"{self.host_url}/rest/job/v1/jobs/{job_id}/decline"
             
             # Rejection payload
             rejection_body = {
@@ -547,18 +1016,19 @@ class GuidewireIntegration:
             }
             
             logger.info(f"Making rejection request to: {decline_url}")
-            logger.info(f"Rejection payload: {json.dumps(rejection_body, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Rejection payload: %s", orjson.dumps(rejection_body, option=orjson.OPT_INDENT_2).decode())
             
-            response = requests.post(
+            response = self.session.post(
                 decline_url,
-                json=rejection_body,
-                auth=(self.username, self.password),
+                data=orjson.dumps(rejection_body),
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.request_timeout
             )
             
             logger.info(f"Decline response status: {response.status_code}")
-            logger.info(f"Decline response: {response.text}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Decline response: %s", _preview(response.text))
             
             if response.status_code in [200, 201]:
                 return {
@@ -570,7 +1040,7 @@ class GuidewireIntegration:
                     "rejected_by": rejected_by
                 }
             else:
-                logger.error(f"Failed to decline submission: {response.status_code} - {response.text}")
+                logger.error(f"Failed to decline submission: {response.status_code} - {_preview(response.text)}")
                 return {
                     "success": False,
                     "job_id": job_id,
@@ -594,8 +1064,19 @@ class GuidewireIntegration:
         """
         logger.info(f"Creating quote and retrieving document for job: {job_id}")
         
-        # Quote creation payload
-        quote_payload = {
+        result = self._make_request(self._build_quote_payload(job_id))
+        return self._parse_quote_result(job_id, result)
+
+    async def create_quote_and_get_document_async(self, job_id: str) -> Dict[str, Any]:
+        """Async variant of create_quote_and_get_document for callers running on the event loop"""
+        logger.info(f"Creating quote and retrieving document for job: {job_id} (async)")
+        
+        result = await self._make_request_async(self._build_quote_payload(job_id))
+        return self._parse_quote_result(job_id, result)
+
+    def _build_quote_payload(self, job_id: str) -> Dict[str, Any]:
+        """Build the quote + quote lookup + documents composite payload for a job"""
+        return {
             "requests": [
                 {
                     "method": "post",
@@ -617,9 +1098,9 @@ class GuidewireIntegration:
                 }
             ]
         }
-        
-        result = self._make_request(quote_payload)
-        
+
+    def _parse_quote_result(self, job_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Pull the quote details and documents out of the quote composite response"""
         if result["success"]:
             try:
                 data = result["data"]
@@ -629,15 +1110,11 @@ class GuidewireIntegration:
                 if "responses" in data:
                     # Parse quote creation response
                     if len(data["responses"]) > 1 and data["responses"][1].get("status") == 200:
-                        quote_response = data["responses"][1].get("body", {})
-                        if "data" in quote_response:
-                            quote_info = quote_response["data"].get("attributes", {})
+                        quote_info = _dig(data["responses"][1], "body", "data", "attributes") or {}
                     
                     # Parse documents response
                     if len(data["responses"]) > 2 and data["responses"][2].get("status") == 200:
-                        docs_response = data["responses"][2].get("body", {})
-                        if "data" in docs_response:
-                            documents = docs_response["data"]
+                        documents = _dig(data["responses"][2], "body", "data") or []
                 
                 return {
                     "success": True,
@@ -668,8 +1145,19 @@ class GuidewireIntegration:
         """
         logger.info(f"Getting document URL for job: {job_id}, document: {document_id}")
         
-        # Document URL payload
-        doc_payload = {
+        result = self._make_request(self._build_document_url_payload(job_id, document_id))
+        return self._parse_document_url_result(job_id, document_id, result)
+
+    async def get_quote_document_url_async(self, job_id: str, document_id: str) -> Dict[str, Any]:
+        """Async variant of get_quote_document_url for callers running on the event loop"""
+        logger.info(f"Getting document URL for job: {job_id}, document: {document_id} (async)")
+        
+        result = await self._make_request_async(self._build_document_url_payload(job_id, document_id))
+        return self._parse_document_url_result(job_id, document_id, result)
+
+    def _build_document_url_payload(self, job_id: str, document_id: str) -> Dict[str, Any]:
+        """Build the composite payload that fetches a document's download URL"""
+        return {
             "requests": [
                 {
                     "method": "get",
@@ -677,9 +1165,9 @@ class GuidewireIntegration:
                 }
             ]
         }
-        
-        result = self._make_request(doc_payload)
-        
+
+    def _parse_document_url_result(self, job_id: str, document_id: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Pull the download URL out of the document composite response"""
         if result["success"]:
             try:
                 data = result["data"]
@@ -713,29 +1201,35 @@ class GuidewireIntegration:
 
     def test_connection(self) -> Dict[str, Any]:
         """Test connection to Guidewire"""
+        cached = self._connection_test_cache
+        if cached and time.monotonic() - cached[0] < self.connection_test_ttl:
+            # Copy so a caller mutating its result can't change what later callers see
+            return dict(cached[1])
+        
         logger.info("Testing Guidewire connection")
         
         # Use a direct REST API call instead of composite for connection test
         try:
-            test_url = "https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/account/v1/account-organization-types"
+            test_url = f"{self.host_url}/rest/account/v1/account-organization-types"
             
             headers = {
                 'Accept': 'application/json'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 test_url,
-                auth=(self.username, self.password),
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.request_timeout
             )
             
             if response.status_code == 200:
-                return {
+                result = {
                     "success": True,
                     "status_code": response.status_code,
                     "message": "Successfully connected to Guidewire"
                 }
+                self._connection_test_cache = (time.monotonic(), dict(result))
+                return result
             else:
                 return {
                     "success": False,
@@ -761,24 +1255,24 @@ class GuidewireIntegration:
         
         try:
             # Use direct REST API call for UW issues
-            uw_issues_url = f"https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/job/v1/jobs/{job_id}/uw-issues"
+            uw_issues_url = f"{self.host_url}/rest/job/v1/jobs/{job_id}/uw-issues"
             
             headers = {
                 'Accept': 'application/json'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 uw_issues_url,
-                auth=(self.username, self.password),
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.request_timeout
             )
             
             logger.info(f"UW issues API response status: {response.status_code}")
             
             if response.status_code == 200:
-                uw_issues_data = response.json()
-                logger.info(f"UW issues response: {json.dumps(uw_issues_data, indent=2)}")
+                uw_issues_data = orjson.loads(response.content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("UW issues response: %s", _preview(uw_issues_data))
                 
                 # Extract UW issues list
                 uw_issues = []
@@ -796,7 +1290,7 @@ class GuidewireIntegration:
                     "message": f"Found {len(uw_issues)} UW issues for job {job_id}"
                 }
             else:
-                logger.error(f"UW issues API failed: {response.status_code} - {response.text}")
+                logger.error(f"UW issues API failed: {response.status_code} - {_preview(response.text)}")
                 return {
                     "success": False,
                     "job_id": job_id,
@@ -823,24 +1317,24 @@ class GuidewireIntegration:
         
         try:
             # Use direct REST API call for documents
-            documents_url = f"https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/job/v1/jobs/{job_id}/documents"
+            documents_url = f"{self.host_url}/rest/job/v1/jobs/{job_id}/documents"
             
             headers = {
                 'Accept': 'application/json'
             }
             
-            response = requests.get(
+            response = self.session.get(
                 documents_url,
-                auth=(self.username, self.password),
                 headers=headers,
-                timeout=self.timeout
+                timeout=self.request_timeout
             )
             
             logger.info(f"Documents API response status: {response.status_code}")
             
             if response.status_code == 200:
-                documents_data = response.json()
-                logger.info(f"Documents response: {json.dumps(documents_data, indent=2)}")
+                documents_data = orjson.loads(response.content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Documents response: %s", _preview(documents_data))
                 
                 # Extract document list
                 documents = []
@@ -858,7 +1352,7 @@ class GuidewireIntegration:
                     "message": f"Found {len(documents)} documents for job {job_id}"
                 }
             else:
-                logger.error(f"Documents API failed: {response.status_code} - {response.text}")
+                logger.error(f"Documents API failed: {response.status_code} - {_preview(response.text)}")
                 return {
                     "success": False,
                     "job_id": job_id,
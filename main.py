@@ -5,7 +5,7 @@ from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, func, select, exists, text
 from datetime import datetime
 import uuid
 import json
@@ -13,6 +13,8 @@ from pydantic import BaseModel
 from dateutil import parser as date_parser
 from database import get_db, Submission, WorkItem, RiskAssessment, Comment, User, WorkItemHistory, WorkItemStatus, WorkItemPriority, CompanySize, Underwriter, SubmissionMessage, create_tables, SubmissionStatus, SubmissionHistory, HistoryAction, QuoteDocument, DocumentType, DocumentStatus
 from llm_service import llm_service
+from guidewire_integration import guidewire_integration
+from business_config import MONEY_STRIP
 from models import (
     EmailIntakePayload, EmailIntakeResponse, LogicAppsEmailPayload,
     SubmissionResponse, SubmissionConfirmRequest, 
@@ -50,6 +52,25 @@ def _parse_extracted_fields(extracted_fields):
     else:
         return {}
 
+# Helper for the debug endpoints that report both table sizes
+def _count_submissions_and_work_items(db: Session):
+    """Return (submission_count, work_item_count) using a single round trip"""
+    return db.query(
+        select(func.count(Submission.id)).scalar_subquery(),
+        select(func.count(WorkItem.id)).scalar_subquery()
+    ).one()
+
+# Common company size variations that don't match a CompanySize value directly
+_COMPANY_SIZE_ALIASES = {
+    'small': CompanySize.SMALL,
+    'medium': CompanySize.MEDIUM,
+    'large': CompanySize.LARGE,
+    'enterprise': CompanySize.ENTERPRISE,
+    'startup': CompanySize.SMALL,
+    'sme': CompanySize.MEDIUM,
+    'multinational': CompanySize.ENTERPRISE
+}
+
 # Create FastAPI app
 app = FastAPI(
     title="Underwriting Workbench API",
@@ -349,6 +370,11 @@ async def startup_event():
     logger.info("Database tables created successfully")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await guidewire_integration.aclose()
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     logger.error("Unhandled exception", exc_info=exc)
@@ -528,16 +554,7 @@ async def email_intake(
                     work_item.company_size = CompanySize(company_size)
                 except ValueError:
                     # Try mapping common variations
-                    size_mapping = {
-                        'small': CompanySize.SMALL,
-                        'medium': CompanySize.MEDIUM,
-                        'large': CompanySize.LARGE,
-                        'enterprise': CompanySize.ENTERPRISE,
-                        'startup': CompanySize.SMALL,
-                        'sme': CompanySize.MEDIUM,
-                        'multinational': CompanySize.ENTERPRISE
-                    }
-                    work_item.company_size = size_mapping.get(str(company_size).lower() if company_size else "")
+                    work_item.company_size = _COMPANY_SIZE_ALIASES.get(str(company_size).lower() if company_size else "")
         
         # Apply validation results to work item
         if validation_status == "Complete":
@@ -612,14 +629,12 @@ async def email_intake(
         guidewire_success = False
         
         try:
-            from guidewire_integration import guidewire_integration
-            
             logger.info("Creating Guidewire account and submission", 
                        work_item_id=work_item.id,
                        validation_status=validation_status)
             
-            # Call our new clean Guidewire integration
-            guidewire_result = guidewire_integration.create_account_and_submission(extracted_data or {})
+            # Call our new clean Guidewire integration (async path keeps the event loop free)
+            guidewire_result = await guidewire_integration.create_account_and_submission_async(extracted_data or {})
             
             if guidewire_result["success"]:
                 # Update work item with both internal IDs and human-readable numbers
@@ -632,7 +647,6 @@ async def email_intake(
                 if guidewire_result.get("job_number"):
                     work_item.guidewire_job_number = guidewire_result["job_number"]
                 
-                db.commit()
                 guidewire_success = True
                 
                 logger.info("Guidewire account and submission created successfully",
@@ -654,6 +668,7 @@ async def email_intake(
                     }
                 )
                 db.add(guidewire_history)
+                # Single commit covers both the Guidewire IDs and the history entry
                 db.commit()
             
             else:
@@ -933,17 +948,8 @@ async def logic_apps_email_intake(
                     work_item.company_size = CompanySize(str(company_size_raw))
                 except ValueError:
                     # Try mapping common variations with safe string conversion
-                    size_mapping = {
-                        'small': CompanySize.SMALL,
-                        'medium': CompanySize.MEDIUM,
-                        'large': CompanySize.LARGE,
-                        'enterprise': CompanySize.ENTERPRISE,
-                        'startup': CompanySize.SMALL,
-                        'sme': CompanySize.MEDIUM,
-                        'multinational': CompanySize.ENTERPRISE
-                    }
                     company_size_str = str(company_size_raw).lower() if company_size_raw else ""
-                    work_item.company_size = size_mapping.get(company_size_str)
+                    work_item.company_size = _COMPANY_SIZE_ALIASES.get(company_size_str)
         
         # Apply validation results to work item
         if validation_status == "Complete":
@@ -1011,14 +1017,12 @@ async def logic_apps_email_intake(
         guidewire_success = False
         
         try:
-            from guidewire_integration import guidewire_integration
-            
             logger.info("Creating Guidewire account and submission (Logic Apps)", 
                        work_item_id=work_item.id,
                        validation_status=validation_status)
             
-            # Call our new clean Guidewire integration
-            guidewire_result = guidewire_integration.create_account_and_submission(extracted_data or {})
+            # Call our new clean Guidewire integration (async path keeps the event loop free)
+            guidewire_result = await guidewire_integration.create_account_and_submission_async(extracted_data or {})
             
             if guidewire_result["success"]:
                 # Update work item with Guidewire IDs
@@ -1027,7 +1031,6 @@ async def logic_apps_email_intake(
                 if guidewire_result.get("job_id"):
                     work_item.guidewire_job_id = guidewire_result["job_id"]
                 
-                db.commit()
                 guidewire_success = True
                 
                 logger.info("Guidewire account and submission created successfully (Logic Apps)",
@@ -1050,6 +1053,7 @@ async def logic_apps_email_intake(
                     }
                 )
                 db.add(guidewire_history)
+                # Single commit covers both the Guidewire IDs and the history entry
                 db.commit()
             
             else:
@@ -1286,8 +1290,7 @@ async def debug_database(db: Session = Depends(get_db)):
     """Debug endpoint to check database connectivity and data"""
     try:
         # Test basic database connection
-        work_item_count = db.query(WorkItem).count()
-        submission_count = db.query(Submission).count()
+        submission_count, work_item_count = _count_submissions_and_work_items(db)
         
         # Get latest work item and submission
         latest_work_item = db.query(WorkItem).order_by(WorkItem.created_at.desc()).first()
@@ -1374,8 +1377,6 @@ async def debug_poll(db: Session = Depends(get_db)):
 async def test_guidewire_numbers_extraction(db: Session = Depends(get_db)):
     """Test extracting human-readable numbers from Guidewire and updating work items"""
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Test data with unique identifier
         test_data = {
             "company_name": f"Number Test {datetime.utcnow().strftime('%H%M%S')}",
@@ -1388,7 +1389,7 @@ async def test_guidewire_numbers_extraction(db: Session = Depends(get_db)):
         logger.info(f"Testing Guidewire number extraction with data: {test_data}")
         
         # Create test submission in Guidewire
-        result = guidewire_integration.create_account_and_submission(test_data)
+        result = await guidewire_integration.create_account_and_submission_async(test_data)
         
         # Get the latest work item to potentially update
         latest_work_item = db.query(WorkItem).order_by(WorkItem.created_at.desc()).first()
@@ -1541,8 +1542,6 @@ async def create_quote_for_work_item(
     This is called after the work item has been approved
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -1558,7 +1557,7 @@ async def create_quote_for_work_item(
                    job_id=work_item.guidewire_job_id)
         
         # Call Guidewire quote creation API
-        result = guidewire_integration.create_quote_and_get_document(work_item.guidewire_job_id)
+        result = await guidewire_integration.create_quote_and_get_document_async(work_item.guidewire_job_id)
         
         if result["success"]:
             # Update work item with quote information
@@ -1637,8 +1636,6 @@ async def get_quote_document_url(
     Get download URL for a specific quote document
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -1652,7 +1649,7 @@ async def get_quote_document_url(
                    document_id=document_id)
         
         # Call Guidewire document URL API
-        result = guidewire_integration.get_quote_document_url(work_item.guidewire_job_id, document_id)
+        result = await guidewire_integration.get_quote_document_url_async(work_item.guidewire_job_id, document_id)
         
         if result["success"]:
             return {
@@ -1688,8 +1685,6 @@ async def test_guidewire_integration():
     Shows the 3-step process we've implemented
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Test sample data
         sample_data = {
             "company_name": "Test Cyber Insurance Co",
@@ -1769,8 +1764,6 @@ async def test_guidewire_connection_live():
     This runs from the whitelisted IP address
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Test the connection
         connection_result = guidewire_integration.test_connection()
         
@@ -1779,6 +1772,7 @@ async def test_guidewire_connection_live():
             "timestamp": datetime.utcnow().isoformat(),
             "deployment_url": "wu-workbench-backend-h3fkfkcpbjgga7hx.centralus-01.azurewebsites.net",
             "guidewire_connection": connection_result,
+            "composite_latency": guidewire_integration.latency_snapshot(),
             "ip_whitelisted": connection_result.get("success", False),
             "message": "Testing from whitelisted IP address" if connection_result.get("success", False) else "Connection failed - check IP whitelisting"
         }
@@ -1799,8 +1793,6 @@ async def test_guidewire_submission_live():
     This uses the exact team format and runs from the whitelisted IP
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Test data with unique identifier for tracking
         test_data = {
             "company_name": f"Debug Test Company {datetime.utcnow().strftime('%H%M%S')}",
@@ -1811,7 +1803,7 @@ async def test_guidewire_submission_live():
         }
         
         # Test the full submission creation
-        submission_result = guidewire_integration.create_account_and_submission(test_data)
+        submission_result = await guidewire_integration.create_account_and_submission_async(test_data)
         
         # Return full details for debugging
         return {
@@ -2016,8 +2008,6 @@ async def test_guidewire_simple_request():
 async def submit_work_item_to_guidewire(work_item_id: int, db: Session = Depends(get_db)):
     """Submit a work item to Guidewire PolicyCenter"""
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item and related submission
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -2063,7 +2053,7 @@ async def submit_work_item_to_guidewire(work_item_id: int, db: Session = Depends
         logger.info(f"Submitting work item {work_item_id} to Guidewire with data: {submission_data}")
         
         # Submit to Guidewire using our new clean integration
-        result = guidewire_integration.create_account_and_submission(submission_data)
+        result = await guidewire_integration.create_account_and_submission_async(submission_data)
         
         if result.get("success"):
             # Update work item with Guidewire IDs
@@ -2161,7 +2151,8 @@ async def poll_workitems(
         # Filter by timestamp if provided
         if since:
             try:
-                since_dt = datetime.fromisoformat(since.replace('Z', '+00:00'))
+                # Python 3.11's fromisoformat accepts the trailing 'Z' directly
+                since_dt = datetime.fromisoformat(since)
                 query = query.filter(WorkItem.created_at > since_dt)
             except ValueError:
                 raise HTTPException(
@@ -2357,11 +2348,18 @@ async def poll_workitems(
 async def debug_orphaned_submissions(db: Session = Depends(get_db)):
     """Check for submissions that don't have corresponding work items"""
     try:
-        # Find submissions that don't have work items
-        orphaned_submissions = db.query(Submission).filter(
-            ~Submission.id.in_(
-                db.query(WorkItem.submission_id).subquery()
-            )
+        # Find submissions that don't have work items (NOT EXISTS plans as an anti-join).
+        # Only the reported columns are selected, so body_text/attachment_content never leave the database
+        orphaned_submissions = db.query(
+            Submission.id,
+            Submission.submission_id,
+            Submission.subject,
+            Submission.sender_email,
+            Submission.created_at,
+            Submission.task_status,
+            Submission.extracted_fields
+        ).filter(
+            ~exists().where(WorkItem.submission_id == Submission.id)
         ).order_by(Submission.created_at.desc()).all()
         
         orphaned_data = []
@@ -2376,11 +2374,13 @@ async def debug_orphaned_submissions(db: Session = Depends(get_db)):
                 "extracted_fields": submission.extracted_fields
             })
         
+        total_submissions, total_work_items = _count_submissions_and_work_items(db)
+        
         return {
             "orphaned_count": len(orphaned_data),
             "orphaned_submissions": orphaned_data,
-            "total_submissions": db.query(Submission).count(),
-            "total_work_items": db.query(WorkItem).count()
+            "total_submissions": total_submissions,
+            "total_work_items": total_work_items
         }
     except Exception as e:
         return {
@@ -2389,18 +2389,64 @@ async def debug_orphaned_submissions(db: Session = Depends(get_db)):
         }
 
 
+# Orphaned submissions are streamed and repaired in batches of this size
+REPAIR_BATCH_SIZE = 500
+
+
+def _flush_repair_batch(db: Session, pending_work_items: list, repaired_at: datetime) -> list:
+    """Insert a batch of repaired work items plus their history entries"""
+    if not pending_work_items:
+        return []
+    
+    # Flush the work items together so their IDs come back from one batched INSERT
+    db.add_all([work_item for _, work_item in pending_work_items])
+    db.flush()
+    
+    created_work_items = []
+    history_entries = []
+    for submission, work_item in pending_work_items:
+        history_entries.append(WorkItemHistory(
+            work_item_id=work_item.id,
+            action=HistoryAction.CREATED,
+            performed_by="System-Repair",
+            performed_by_name="System-Repair",
+            timestamp=repaired_at,
+            details={
+                "repair_action": "Created missing work item for orphaned submission",
+                "submission_ref": submission.submission_ref
+            }
+        ))
+        created_work_items.append({
+            "work_item_id": work_item.id,
+            "submission_id": submission.id,
+            "submission_ref": submission.submission_ref,
+            "title": work_item.title
+        })
+    db.add_all(history_entries)
+    
+    return created_work_items
+
+
 @app.post("/api/debug/create-missing-work-items")
 async def create_missing_work_items(db: Session = Depends(get_db)):
     """Create work items for submissions that don't have them"""
     try:
-        # Find submissions that don't have work items
-        orphaned_submissions = db.query(Submission).filter(
-            ~Submission.id.in_(
-                db.query(WorkItem.submission_id).subquery()
-            )
-        ).all()
+        # Find submissions that don't have work items, streaming rows instead of loading them all.
+        # Plain column rows are enough to build the work items and skip ORM instance bookkeeping
+        orphaned_submissions = db.query(
+            Submission.id,
+            Submission.submission_ref,
+            Submission.subject,
+            Submission.sender_email,
+            Submission.extracted_fields
+        ).filter(
+            ~exists().where(WorkItem.submission_id == Submission.id)
+        ).yield_per(REPAIR_BATCH_SIZE)
         
+        # One timestamp for the whole repair run instead of a clock read per row
+        repaired_at = datetime.utcnow()
         created_work_items = []
+        pending_work_items = []
         errors = []
         
         for submission in orphaned_submissions:
@@ -2412,13 +2458,15 @@ async def create_missing_work_items(db: Session = Depends(get_db)):
                     description=f"Email from {submission.sender_email}",
                     status=WorkItemStatus.PENDING,
                     priority=WorkItemPriority.MEDIUM,
-                    assigned_to=None
+                    assigned_to=None,
+                    created_at=repaired_at,
+                    updated_at=repaired_at
                 )
                 
-                # Try to apply extracted data if available
+                # Try to apply extracted data if available (JSON columns arrive as dicts, legacy rows as strings)
                 if submission.extracted_fields:
-                    extracted_data = submission.extracted_fields
-                    if isinstance(extracted_data, dict):
+                    extracted_data = _parse_extracted_fields(submission.extracted_fields)
+                    if extracted_data:
                         # Set basic fields
                         work_item.industry = extracted_data.get('industry')
                         work_item.policy_type = extracted_data.get('policy_type') or extracted_data.get('coverage_type')
@@ -2428,9 +2476,8 @@ async def create_missing_work_items(db: Session = Depends(get_db)):
                         if coverage_raw:
                             try:
                                 # Remove currency symbols and parse
-                                coverage_clean = str(coverage_raw).replace('$', '').replace(',', '')
-                                work_item.coverage_amount = float(coverage_clean)
-                            except:
+                                work_item.coverage_amount = float(str(coverage_raw).translate(MONEY_STRIP))
+                            except (TypeError, ValueError):
                                 pass
                         
                         # Set company size if available
@@ -2440,37 +2487,9 @@ async def create_missing_work_items(db: Session = Depends(get_db)):
                                 work_item.company_size = CompanySize(company_size)
                             except ValueError:
                                 # Try mapping common variations
-                                size_mapping = {
-                                    'small': CompanySize.SMALL,
-                                    'medium': CompanySize.MEDIUM,
-                                    'large': CompanySize.LARGE,
-                                    'enterprise': CompanySize.ENTERPRISE
-                                }
-                                work_item.company_size = size_mapping.get(str(company_size).lower())
+                                work_item.company_size = _COMPANY_SIZE_ALIASES.get(str(company_size).lower())
                 
-                db.add(work_item)
-                db.flush()  # Get ID
-                
-                # Create history entry
-                history_entry = WorkItemHistory(
-                    work_item_id=work_item.id,
-                    action=HistoryAction.CREATED,
-                    performed_by="System-Repair",
-                    performed_by_name="System-Repair",
-                    timestamp=datetime.utcnow(),
-                    details={
-                        "repair_action": "Created missing work item for orphaned submission",
-                        "submission_ref": submission.submission_ref
-                    }
-                )
-                db.add(history_entry)
-                
-                created_work_items.append({
-                    "work_item_id": work_item.id,
-                    "submission_id": submission.id,
-                    "submission_ref": submission.submission_ref,
-                    "title": work_item.title
-                })
+                pending_work_items.append((submission, work_item))
                 
             except Exception as e:
                 errors.append({
@@ -2478,8 +2497,18 @@ async def create_missing_work_items(db: Session = Depends(get_db)):
                     "submission_ref": submission.submission_ref,
                     "error": str(e)
                 })
+            
+            if len(pending_work_items) >= REPAIR_BATCH_SIZE:
+                created_work_items.extend(_flush_repair_batch(db, pending_work_items, repaired_at))
+                pending_work_items = []
+        
+        created_work_items.extend(_flush_repair_batch(db, pending_work_items, repaired_at))
         
         if created_work_items:
+            # The repair is idempotent (re-running re-selects only remaining orphans),
+            # so the one-off commit doesn't need to wait for the WAL flush
+            if db.bind.dialect.name == "postgresql":
+                db.execute(text("SET LOCAL synchronous_commit TO OFF"))
             db.commit()
         
         return {
@@ -2807,7 +2836,7 @@ async def get_assignment_options(
                 x.level.value if hasattr(x, 'level') and x.level else "JUNIOR",
                 x.current_workload or 0
             ))
-        except:
+        except (AttributeError, TypeError):
             all_underwriters = sorted(all_underwriters, key=lambda x: x.current_workload or 0)
         
         # Categorize recommendations
@@ -2910,15 +2939,23 @@ async def cleanup_duplicate_work_items(db: Session = Depends(get_db)):
         
         duplicates = db.query(WorkItem.submission_id, func.count(WorkItem.id).label('count')).group_by(WorkItem.submission_id).having(func.count(WorkItem.id) > 1).all()
         
+        # Load every work item of the affected submissions in one query, newest first per submission
+        duplicate_submission_ids = [submission_id for submission_id, _ in duplicates]
+        work_items = []
+        if duplicate_submission_ids:
+            work_items = db.query(WorkItem).filter(
+                WorkItem.submission_id.in_(duplicate_submission_ids)
+            ).order_by(WorkItem.submission_id, WorkItem.created_at.desc()).all()
+        
         removed_count = 0
-        for submission_id, count in duplicates:
-            # Get all work items for this submission, ordered by creation date (keep newest)
-            work_items = db.query(WorkItem).filter(WorkItem.submission_id == submission_id).order_by(WorkItem.created_at.desc()).all()
-            
-            # Remove all except the first (most recent)
-            for work_item in work_items[1:]:
-                db.delete(work_item)
-                removed_count += 1
+        kept_submission_ids = set()
+        for work_item in work_items:
+            # Keep the first (most recent) work item per submission and remove the rest
+            if work_item.submission_id not in kept_submission_ids:
+                kept_submission_ids.add(work_item.submission_id)
+                continue
+            db.delete(work_item)
+            removed_count += 1
         
         db.commit()
         
@@ -2939,22 +2976,23 @@ async def debug_duplicate_work_items(db: Session = Depends(get_db)):
     """Debug endpoint to identify duplicate work items"""
     from sqlalchemy import func
     
-    # Find submissions with multiple work items
+    # Find submissions with multiple work items, joining the submission ref in the same query
     duplicates = db.query(
         WorkItem.submission_id, 
         func.count(WorkItem.id).label('work_item_count'),
-        func.array_agg(WorkItem.id).label('work_item_ids')
-    ).group_by(WorkItem.submission_id).having(func.count(WorkItem.id) > 1).all()
+        func.array_agg(WorkItem.id).label('work_item_ids'),
+        Submission.submission_ref
+    ).outerjoin(
+        Submission, WorkItem.submission_id == Submission.id
+    ).group_by(WorkItem.submission_id, Submission.submission_ref).having(func.count(WorkItem.id) > 1).all()
     
-    total_work_items = db.query(WorkItem).count()
-    total_submissions = db.query(Submission).count()
+    total_submissions, total_work_items = _count_submissions_and_work_items(db)
     
     duplicate_details = []
-    for submission_id, count, work_item_ids in duplicates:
-        submission = db.query(Submission).filter(Submission.id == submission_id).first()
+    for submission_id, count, work_item_ids, submission_ref in duplicates:
         duplicate_details.append({
             "submission_id": submission_id,
-            "submission_ref": str(submission.submission_ref) if submission else "Unknown",
+            "submission_ref": str(submission_ref) if submission_ref else "Unknown",
             "work_item_count": count,
             "work_item_ids": work_item_ids
         })
@@ -3437,19 +3475,17 @@ async def test_guidewire_connection():
 @app.get("/api/debug/test-simple-guidewire")
 async def test_simple_guidewire():
     """Test simple Guidewire requests to debug API issues"""
-    import requests
     import json
     
-    composite_url = "https://pc-dev-gwcpdev.valuemom.zeta1-andromeda.guidewire.net/rest/composite/v1/composite"
-    username = "su"
-    password = "gw"
+    composite_url = guidewire_integration.base_url
+    username = guidewire_integration.username
     
-    session = requests.Session()
-    session.auth = (username, password)
-    session.headers.update({
+    # Reuse the integration's pooled, already-authenticated session instead of a throwaway one
+    session = guidewire_integration.session
+    headers = {
         'Content-Type': 'application/json',
         'Accept': 'application/json'
-    })
+    }
     
     results = {}
     
@@ -3464,7 +3500,7 @@ async def test_simple_guidewire():
             ]
         }
         
-        response = session.post(composite_url, json=ping_request, timeout=30)
+        response = session.post(composite_url, json=ping_request, headers=headers, timeout=30)
         results["ping_test"] = {
             "status_code": response.status_code,
             "response": response.text,
@@ -3512,7 +3548,7 @@ async def test_simple_guidewire():
             ]
         }
         
-        response = session.post(composite_url, json=create_request, timeout=30)
+        response = session.post(composite_url, json=create_request, headers=headers, timeout=30)
         results["account_creation"] = {
             "status_code": response.status_code,
             "response": response.text,
@@ -3636,8 +3672,6 @@ async def get_submission_documents(
     UI team can use this to show available documents to download
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -3652,7 +3686,7 @@ async def get_submission_documents(
         logger.info(f"Getting documents for work item {work_item_id}, job: {work_item.guidewire_job_id}")
         
         # Create quote and get documents from Guidewire
-        result = guidewire_integration.create_quote_and_get_document(work_item.guidewire_job_id)
+        result = await guidewire_integration.create_quote_and_get_document_async(work_item.guidewire_job_id)
         
         if result.get("success"):
             documents = result.get("documents", [])
@@ -3711,7 +3745,6 @@ async def download_submission_document(
     UI team can use this for direct document download links
     """
     try:
-        from guidewire_integration import guidewire_integration
         import httpx
         
         # Get the work item
@@ -3728,7 +3761,7 @@ async def download_submission_document(
         logger.info(f"Downloading document {document_id} for work item {work_item_id}")
         
         # Get document download URL from Guidewire
-        result = guidewire_integration.get_quote_document_url(work_item.guidewire_job_id, document_id)
+        result = await guidewire_integration.get_quote_document_url_async(work_item.guidewire_job_id, document_id)
         
         if result.get("success"):
             download_url = result.get("download_url")
@@ -3788,8 +3821,6 @@ async def generate_quote_for_submission(
     UI team can call this to trigger quote generation
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -3804,7 +3835,7 @@ async def generate_quote_for_submission(
         logger.info(f"Generating quote for work item {work_item_id}, job: {work_item.guidewire_job_id}")
         
         # Generate quote and get documents
-        result = guidewire_integration.create_quote_and_get_document(work_item.guidewire_job_id)
+        result = await guidewire_integration.create_quote_and_get_document_async(work_item.guidewire_job_id)
         
         if result.get("success"):
             # Add quote generation to work item history
@@ -3862,7 +3893,6 @@ async def fetch_and_store_quote_documents(
     This downloads the actual document content and stores it locally
     """
     try:
-        from guidewire_integration import guidewire_integration
         import httpx
         import base64
         
@@ -3880,7 +3910,7 @@ async def fetch_and_store_quote_documents(
         logger.info(f"Fetching and storing documents for work item {work_item_id}")
         
         # Get documents from Guidewire
-        result = guidewire_integration.create_quote_and_get_document(work_item.guidewire_job_id)
+        result = await guidewire_integration.create_quote_and_get_document_async(work_item.guidewire_job_id)
         
         if not result.get("success"):
             return {
@@ -3921,7 +3951,7 @@ async def fetch_and_store_quote_documents(
                         continue
                     
                     # Get document download URL from Guidewire
-                    url_result = guidewire_integration.get_quote_document_url(work_item.guidewire_job_id, doc_id)
+                    url_result = await guidewire_integration.get_quote_document_url_async(work_item.guidewire_job_id, doc_id)
                     
                     if not url_result.get("success"):
                         errors.append({
@@ -4267,8 +4297,6 @@ async def test_guidewire_documents(
     Test document retrieval directly from Guidewire using job ID
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         job_id = job_data.get("job_id")
         job_number = job_data.get("job_number", "Unknown")
         
@@ -4310,8 +4338,6 @@ async def approve_submission(
     Approve a submission in Guidewire by approving UW issues
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -4421,8 +4447,6 @@ async def reject_submission(
     Reject a submission in Guidewire
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -4611,8 +4635,6 @@ async def get_uw_issues(
     Get UW issues for a work item from Guidewire
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         # Get the work item
         work_item = db.query(WorkItem).filter(WorkItem.id == work_item_id).first()
         if not work_item:
@@ -4661,8 +4683,6 @@ async def test_approval_workflow(
     Test the complete approval workflow with a specific job ID
     """
     try:
-        from guidewire_integration import guidewire_integration
-        
         job_id = test_data.get("job_id")
         if not job_id:
             raise HTTPException(status_code=400, detail="job_id is required")
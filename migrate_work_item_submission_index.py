@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Database Migration: Add index on work_items.submission_id
+Run this script to add the index to existing databases (new databases get it from create_tables)
+"""
+
+from sqlalchemy import text, inspect
+from database import engine
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "ix_work_items_submission_id"
+
+def migrate_add_submission_index():
+    """Create the work_items.submission_id index if it doesn't exist"""
+
+    try:
+        with engine.connect() as connection:
+            # Check if index already exists
+            inspector = inspect(engine)
+            index_names = [index['name'] for index in inspector.get_indexes('work_items')]
+
+            if INDEX_NAME in index_names:
+                logger.info(f"✅ {INDEX_NAME} already exists")
+                return True
+
+            # Add the index
+            logger.info(f"📝 Creating {INDEX_NAME} on work_items(submission_id)...")
+
+            connection.execute(text(f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON work_items (submission_id);"))
+            connection.commit()
+
+            # Verify the index was added
+            inspector = inspect(engine)
+            index_names = [index['name'] for index in inspector.get_indexes('work_items')]
+
+            if INDEX_NAME in index_names:
+                logger.info(f"✅ Migration verified: {INDEX_NAME} exists")
+                return True
+            else:
+                logger.error("❌ Migration failed: index was not created")
+                return False
+
+    except Exception as e:
+        logger.error(f"❌ Migration failed: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    logger.info("🚀 WORK ITEM SUBMISSION INDEX MIGRATION")
+    logger.info("=" * 50)
+
+    success = migrate_add_submission_index()
+
+    if success:
+        logger.info("\n" + "=" * 50)
+        logger.info("🎉 MIGRATION COMPLETE!")
+        logger.info("\nOrphaned-submission and work item lookups by submission can now use the index.")
+    else:
+        logger.error("\n" + "=" * 50)
+        logger.error("❌ MIGRATION FAILED!")
+        logger.error("Please check the database connection and permissions.")
@@ -7,12 +7,12 @@ from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
 from pydantic import BaseModel, Field
 import logging
 import uuid
 
 from database import get_db, WorkItem, GuidewireResponse, WorkItemHistory
-from guidewire_client import guidewire_client
 
 logger = logging.getLogger(__name__)
 
@@ -551,9 +551,9 @@ def format_quote_from_guidewire(guidewire_response: GuidewireResponse, quote_id:
         "account_number": guidewire_response.account_number,
         "job_number": guidewire_response.job_number,
         "effective_date": guidewire_response.job_effective_date,
-        "expiration_date": guidewire_response.job_effective_date.replace(
-            year=guidewire_response.job_effective_date.year + 1
-        ) if guidewire_response.job_effective_date else None,
+        # relativedelta clamps Feb 29 to Feb 28 instead of raising like date.replace(year=...)
+        "expiration_date": guidewire_response.job_effective_date + relativedelta(years=1)
+        if guidewire_response.job_effective_date else None,
         
         "coverage_summary": {
             "policy_type": "Commercial Cyber Liability",
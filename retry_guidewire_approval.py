@@ -10,6 +10,7 @@ from database import get_db, WorkItem
 from sqlalchemy.orm import Session
 from sqlalchemy import create_engine
 from config import settings
+import random
 import time
 
 def retry_guidewire_approval(job_number):
@@ -47,8 +48,10 @@ def retry_guidewire_approval(job_number):
             
         print(f"\n🔧 Attempting to re-approve in Guidewire using job ID: {guidewire_job_id}")
         
-        # Try multiple connection attempts
+        # Try multiple connection attempts, backing off exponentially between them.
+        # Starts at 5 s so a recovering Guidewire isn't probed again straight away.
         max_retries = 3
+        delay = 5.0
         for attempt in range(1, max_retries + 1):
             print(f"\n📡 Attempt {attempt}/{max_retries}: Testing Guidewire connection...")
             
@@ -60,17 +63,16 @@ def retry_guidewire_approval(job_number):
                     break
                 else:
                     print(f"❌ Connection failed: {conn_result.get('message')}")
-                    if attempt < max_retries:
-                        print(f"   Retrying in 5 seconds...")
-                        time.sleep(5)
-                    continue
                     
             except Exception as e:
                 print(f"❌ Connection error: {e}")
-                if attempt < max_retries:
-                    print(f"   Retrying in 5 seconds...")
-                    time.sleep(5)
-                continue
+            
+            if attempt < max_retries:
+                # Up to 50% jitter on top of the base delay so retries don't line up
+                wait = random.uniform(delay, delay * 1.5)
+                print(f"   Retrying in {wait:.0f} seconds...")
+                time.sleep(wait)
+                delay = min(delay * 2, 20.0)
         else:
             print("❌ Failed to connect to Guidewire after all attempts")
             print("\n💡 MANUAL SOLUTION:")
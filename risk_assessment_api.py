@@ -136,7 +136,7 @@ async def perform_risk_assessment(
             assessment_date=datetime.utcnow(),
             assessed_by=request.assessed_by,
             assessment_notes=request.assessment_notes or "Comprehensive risk assessment using advanced engine",
-            next_review_date=datetime.fromisoformat(assessment_result["next_review_date"].replace("Z", "+00:00"))
+            next_review_date=datetime.fromisoformat(assessment_result["next_review_date"])
         )
         
         db.add(risk_assessment)
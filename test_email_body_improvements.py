@@ -5,12 +5,17 @@ Tests that HTML emails are properly processed and stored
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 
 # Test with production server
 BASE_URL = "https://wu-workbench-backend-h3fkfkcpbjgga7hx.centralus-01.azurewebsites.net"
 
+# Shared session so the intake and retrieval calls reuse one keep-alive connection
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
 def test_html_email_processing():
     """Test HTML email processing and storage"""
     
@@ -73,7 +78,7 @@ def test_html_email_processing():
         print("📧 Sending HTML email to processing endpoint...")
         
         # Send to Logic Apps endpoint (handles HTML better)
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/logicapps/email/intake",
             json=test_payload,
             headers={"Content-Type": "application/json"}
@@ -87,15 +92,12 @@ def test_html_email_processing():
             print(f"Submission ID: {result.get('submission_id')}")
             print(f"Work Item ID: {result.get('work_item_id')}")
             
-            # Wait a moment for database write
-            import time
-            time.sleep(1)
-            
+            # Intake commits before it responds, so the content is readable straight away
             # Now test retrieving the email content
             print("\n📥 Testing email content retrieval...")
             
             # Test email content endpoint
-            content_response = requests.get(f"{BASE_URL}/api/workitems/email-content?limit=1")
+            content_response = SESSION.get(f"{BASE_URL}/api/workitems/email-content?limit=1")
             
             if content_response.status_code == 200:
                 content_data = content_response.json()
@@ -185,7 +187,7 @@ def test_plain_text_email():
     try:
         print("📧 Sending plain text email to processing endpoint...")
         
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/api/logicapps/email/intake",
             json=test_payload,
             headers={"Content-Type": "application/json"}